@@ -5,11 +5,14 @@ These fixtures provide test infrastructure that is independent of
 the specific business logic in the template.
 """
 
+import asyncio
 import sys
 from pathlib import Path
 from unittest.mock import patch
 
+import mcp.types as types
 import pytest
+import pytest_asyncio
 
 # Add server directory to path for imports
 SERVER_DIR = Path(__file__).resolve().parent.parent
@@ -27,3 +30,65 @@ def mock_load_widget_html(mock_widget_html):
     """Patch load_widget_html to return mock HTML."""
     with patch("main.load_widget_html", return_value=mock_widget_html):
         yield mock_widget_html
+
+
+@pytest.fixture(scope="session")
+def main_module():
+    """The server module, imported once for the whole test session."""
+    import main
+    return main
+
+
+@pytest.fixture(scope="session")
+def widgets(main_module):
+    """All registered widgets."""
+    return list(main_module.WIDGETS)
+
+
+@pytest.fixture(scope="session")
+def tool_metas(main_module, widgets):
+    """get_tool_meta() output for each widget, keyed by identifier."""
+    return {w.identifier: main_module.get_tool_meta(w) for w in widgets}
+
+
+@pytest_asyncio.fixture(scope="session")
+async def tools_list(main_module):
+    """Result of list_tools(), built once per session."""
+    return await main_module.list_tools()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def resources_list(main_module):
+    """Result of list_resources(), built once per session."""
+    return await main_module.list_resources()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def tool_results(main_module, widgets):
+    """handle_call_tool() result for each widget, called with no arguments."""
+    requests = [
+        types.CallToolRequest(
+            method="tools/call",
+            params=types.CallToolRequestParams(
+                name=widget.identifier,
+                arguments={},
+            ),
+        )
+        for widget in widgets
+    ]
+    results = await asyncio.gather(*(main_module.handle_call_tool(r) for r in requests))
+    return dict(zip([w.identifier for w in widgets], results))
+
+
+@pytest_asyncio.fixture(scope="session")
+async def resource_contents(main_module, widgets):
+    """handle_read_resource() result for each widget, keyed by identifier."""
+    requests = [
+        types.ReadResourceRequest(
+            method="resources/read",
+            params=types.ReadResourceRequestParams(uri=widget.template_uri),
+        )
+        for widget in widgets
+    ]
+    results = await asyncio.gather(*(main_module.handle_read_resource(r) for r in requests))
+    return dict(zip([w.identifier for w in widgets], results))
@@ -26,9 +26,6 @@ from typing import List, Dict
 from dataclasses import dataclass
 from pathlib import Path
 
-import sys
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-
 from pydantic import BaseModel
 import mcp.types as types
 
@@ -136,6 +133,9 @@ class ChatGPTGuidelinesReport:
 # Global report instance
 _report = ChatGPTGuidelinesReport()
 
+# The report is module state, so keep every check on one xdist worker
+pytestmark = pytest.mark.xdist_group("chatgpt_app_guidelines")
+
 
 # =============================================================================
 # 1. VALUE PROPOSITION TESTS (Know/Do/Show)
@@ -16,10 +16,7 @@ import pytest
 from pydantic import BaseModel, ValidationError
 import inspect
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-
+# server/ is put on sys.path by conftest.py
 import main
 
 
@@ -21,10 +21,7 @@ import json
 import inspect
 from typing import List, Tuple, Dict, Any, Set
 from dataclasses import dataclass
-
-import sys
 from pathlib import Path
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from pydantic import BaseModel
 import mcp.types as types
@@ -135,6 +132,9 @@ class MCPBestPracticesReport:
 # Global report instance for collecting results
 _report = MCPBestPracticesReport()
 
+# The report is module state, so keep every check on one xdist worker
+pytestmark = pytest.mark.xdist_group("mcp_best_practices")
+
 
 def grade_check(category: str, check_name: str, weight: float = 1.0):
     """Decorator to register a grading check."""
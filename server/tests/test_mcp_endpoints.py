@@ -13,10 +13,6 @@ as long as they follow the established patterns.
 
 import pytest
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-
 import mcp.types as types
 
 
@@ -33,21 +29,15 @@ class TestListTools:
         assert isinstance(tools, list)
         assert all(isinstance(t, types.Tool) for t in tools)
 
-    @pytest.mark.asyncio
-    async def test_tools_have_required_fields(self):
+    def test_tools_have_required_fields(self, tools_list):
         """Each tool has all required fields."""
-        from main import list_tools
-
-        tools = await list_tools()
-
-        for tool in tools:
+        for tool in tools_list:
             assert tool.name is not None, "Tool must have a name"
             assert tool.title is not None, "Tool must have a title"
             assert tool.description is not None, "Tool must have a description"
             assert tool.inputSchema is not None, "Tool must have an inputSchema"
 
-    @pytest.mark.asyncio
-    async def test_get_tool_meta_is_used(self):
+    def test_get_tool_meta_is_used(self):
         """Verify that get_tool_meta produces correct metadata structure."""
         from main import get_tool_meta, WIDGETS
 
@@ -61,28 +51,18 @@ class TestListTools:
             assert meta["openai/widgetAccessible"] is True
             assert meta["openai/resultCanProduceWidget"] is True
 
-    @pytest.mark.asyncio
-    async def test_tools_have_correct_annotations(self):
+    def test_tools_have_correct_annotations(self, tools_list):
         """Each tool has correct safety annotations."""
-        from main import list_tools
-
-        tools = await list_tools()
-
-        for tool in tools:
+        for tool in tools_list:
             assert tool.annotations is not None
             # Widget tools should be read-only and non-destructive
             # Access as Pydantic model attributes
             assert tool.annotations.destructiveHint is False
             assert tool.annotations.readOnlyHint is True
 
-    @pytest.mark.asyncio
-    async def test_tool_count_matches_widgets(self):
+    def test_tool_count_matches_widgets(self, tools_list, widgets):
         """Number of tools matches number of widgets."""
-        from main import list_tools, WIDGETS
-
-        tools = await list_tools()
-
-        assert len(tools) == len(WIDGETS)
+        assert len(tools_list) == len(widgets)
 
 
 class TestListResources:
@@ -254,18 +234,10 @@ class TestHandleReadResource:
 
         assert len(result.root.contents) == 0
 
-    @pytest.mark.asyncio
-    async def test_all_widgets_resources_readable(self):
+    def test_all_widgets_resources_readable(self, widgets, resource_contents):
         """All registered widget resources can be read."""
-        from main import handle_read_resource, WIDGETS
-
-        for widget in WIDGETS:
-            request = types.ReadResourceRequest(
-                method="resources/read",
-                params=types.ReadResourceRequestParams(uri=widget.template_uri),
-            )
-
-            result = await handle_read_resource(request)
+        for widget in widgets:
+            result = resource_contents[widget.identifier]
 
             assert len(result.root.contents) == 1, f"Widget {widget.identifier} resource not readable"
 
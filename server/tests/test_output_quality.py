@@ -22,13 +22,10 @@ References:
 
 import pytest
 import json
-import sys
 from pathlib import Path
 from typing import List, Dict, Any, Set
 from dataclasses import dataclass
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-
 import mcp.types as types
 
 
@@ -135,6 +132,9 @@ class OutputQualityReport:
 # Global report instance
 _report = OutputQualityReport()
 
+# The report is module state, so keep every check on one xdist worker
+pytestmark = pytest.mark.xdist_group("output_quality")
+
 
 # =============================================================================
 # HELPER FUNCTIONS
@@ -14,9 +14,6 @@ from unittest.mock import patch, MagicMock
 import tempfile
 import os
 
-import sys
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-
 
 class TestLoadWidgetHtml:
     """Tests for load_widget_html function."""